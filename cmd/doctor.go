@@ -3,6 +3,7 @@ package cmd
 import (
 	"encoding/json"
 	"fmt"
+	"io/fs"
 	"os"
 	"os/exec"
 	"path/filepath"
@@ -279,11 +280,16 @@ func checkDisk() CheckResult {
 		return result
 	}
 
-	// Count files and total size
+	// Count files and total size. WalkDir uses the directory entries' cached
+	// type bits, so only regular files need a stat for their size.
 	var totalSize int64
 	var fileCount int
-	filepath.Walk(logsDir, func(path string, info os.FileInfo, err error) error {
-		if err != nil || info.IsDir() {
+	filepath.WalkDir(logsDir, func(path string, d fs.DirEntry, err error) error {
+		if err != nil || d.IsDir() {
+			return nil
+		}
+		info, err := d.Info()
+		if err != nil {
 			return nil
 		}
 		totalSize += info.Size()
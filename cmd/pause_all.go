@@ -73,6 +73,11 @@ Multiple filters are combined with AND logic (all conditions must match).`,
 			return fmt.Errorf("failed to list agents: %w", err)
 		}
 
+		// Lowercase filters once rather than per agent
+		nameFilter := strings.ToLower(pauseAllName)
+		promptFilter := strings.ToLower(pauseAllPrompt)
+		modelFilter := strings.ToLower(pauseAllModel)
+
 		// Filter to only running (not already paused) and apply filters
 		var toPause []*state.AgentState
 		for _, agent := range agents {
@@ -81,17 +86,17 @@ Multiple filters are combined with AND logic (all conditions must match).`,
 			}
 
 			// Apply name filter (substring, case-insensitive)
-			if pauseAllName != "" && !strings.Contains(strings.ToLower(agent.Name), strings.ToLower(pauseAllName)) {
+			if nameFilter != "" && !strings.Contains(strings.ToLower(agent.Name), nameFilter) {
 				continue
 			}
 
 			// Apply prompt filter (substring, case-insensitive)
-			if pauseAllPrompt != "" && !strings.Contains(strings.ToLower(agent.Prompt), strings.ToLower(pauseAllPrompt)) {
+			if promptFilter != "" && !strings.Contains(strings.ToLower(agent.Prompt), promptFilter) {
 				continue
 			}
 
 			// Apply model filter (substring, case-insensitive)
-			if pauseAllModel != "" && !strings.Contains(strings.ToLower(agent.Model), strings.ToLower(pauseAllModel)) {
+			if modelFilter != "" && !strings.Contains(strings.ToLower(agent.Model), modelFilter) {
 				continue
 			}
 
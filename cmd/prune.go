@@ -129,15 +129,19 @@ Supported duration formats: 30s, 5m, 2h, 1d (days), 7d.`,
 			}
 		}
 
-		// Remove all terminated agents
+		// Remove all terminated agents in one state update rather than
+		// rewriting the state file once per agent
+		ids := make([]string, len(terminated))
+		for i, agent := range terminated {
+			ids[i] = agent.ID
+		}
+		if err := mgr.RemoveMany(ids); err != nil {
+			return fmt.Errorf("failed to remove agents: %w", err)
+		}
+
 		removed := 0
 		logsRemoved := 0
 		for _, agent := range terminated {
-			if err := mgr.Remove(agent.ID); err != nil {
-				fmt.Printf("Warning: failed to remove agent %s: %v\n", agent.ID, err)
-				continue
-			}
-
 			// Clean up log file if requested
 			if pruneLogs && agent.LogFile != "" {
 				if err := os.Remove(agent.LogFile); err != nil {
@@ -72,6 +72,11 @@ Multiple filters are combined with AND logic (all conditions must match).`,
 			return fmt.Errorf("failed to list agents: %w", err)
 		}
 
+		// Lowercase filters once rather than per agent
+		nameFilter := strings.ToLower(resumeAllName)
+		promptFilter := strings.ToLower(resumeAllPrompt)
+		modelFilter := strings.ToLower(resumeAllModel)
+
 		// Filter to only paused agents and apply filters
 		var toResume []*state.AgentState
 		for _, agent := range agents {
@@ -80,17 +85,17 @@ Multiple filters are combined with AND logic (all conditions must match).`,
 			}
 
 			// Apply name filter (substring, case-insensitive)
-			if resumeAllName != "" && !strings.Contains(strings.ToLower(agent.Name), strings.ToLower(resumeAllName)) {
+			if nameFilter != "" && !strings.Contains(strings.ToLower(agent.Name), nameFilter) {
 				continue
 			}
 
 			// Apply prompt filter (substring, case-insensitive)
-			if resumeAllPrompt != "" && !strings.Contains(strings.ToLower(agent.Prompt), strings.ToLower(resumeAllPrompt)) {
+			if promptFilter != "" && !strings.Contains(strings.ToLower(agent.Prompt), promptFilter) {
 				continue
 			}
 
 			// Apply model filter (substring, case-insensitive)
-			if resumeAllModel != "" && !strings.Contains(strings.ToLower(agent.Model), strings.ToLower(resumeAllModel)) {
+			if modelFilter != "" && !strings.Contains(strings.ToLower(agent.Model), modelFilter) {
 				continue
 			}
 
@@ -169,14 +169,14 @@ func (cf *ComposeFile) Validate() error {
 		return fmt.Errorf("no tasks defined in compose file")
 	}
 
+	// Validate each task, its dependencies, and its parallelism-expanded
+	// instance names in a single pass over the tasks
 	for name, task := range cf.Tasks {
 		if err := task.Validate(name); err != nil {
 			return err
 		}
-	}
 
-	// Validate task dependencies reference existing tasks
-	for name, task := range cf.Tasks {
+		// Validate task dependencies reference existing tasks
 		for _, dep := range task.DependsOn {
 			if _, exists := cf.Tasks[dep.Task]; !exists {
 				return fmt.Errorf("task %q: depends on unknown task %q", name, dep.Task)
@@ -185,17 +185,8 @@ func (cf *ComposeFile) Validate() error {
 				return fmt.Errorf("task %q: cannot depend on itself", name)
 			}
 		}
-	}
-
-	// Validate pipelines
-	for name, pipeline := range cf.Pipelines {
-		if err := pipeline.Validate(name, cf.Tasks); err != nil {
-			return err
-		}
-	}
 
-	// Check for name collisions between parallelism-expanded instances and existing task names
-	for name, task := range cf.Tasks {
+		// Check for name collisions between parallelism-expanded instances and existing task names
 		p := task.EffectiveParallelism()
 		if p > 1 {
 			for j := 1; j <= p; j++ {
@@ -207,8 +198,13 @@ func (cf *ComposeFile) Validate() error {
 		}
 	}
 
-	// Check for name collisions between parallelism-expanded pipeline instances and existing pipeline names
+	// Validate pipelines and check for name collisions between
+	// parallelism-expanded pipeline instances and existing pipeline names
 	for name, pipeline := range cf.Pipelines {
+		if err := pipeline.Validate(name, cf.Tasks); err != nil {
+			return err
+		}
+
 		p := pipeline.EffectiveParallelism()
 		if p > 1 {
 			for j := 1; j <= p; j++ {
@@ -399,6 +395,9 @@ func (cf *ComposeFile) GetStandaloneTasks() map[string]Task {
 		}
 	}
 
+	// Build set of tasks that some other task depends on
+	dependedOn := cf.dependedOnTasks()
+
 	// Find tasks that are standalone (not in pipeline AND no dependencies)
 	standalone := make(map[string]Task)
 	for name, task := range cf.Tasks {
@@ -411,7 +410,7 @@ func (cf *ComposeFile) GetStandaloneTasks() map[string]Task {
 			continue
 		}
 		// Skip if another task depends on this task (it's part of a DAG)
-		if cf.isDependent(name) {
+		if dependedOn[name] {
 			continue
 		}
 		standalone[name] = task
@@ -456,14 +455,14 @@ func (cf *ComposeFile) Warnings() []string {
 	return warnings
 }
 
-// isDependent returns true if any task depends on the given task name.
-func (cf *ComposeFile) isDependent(taskName string) bool {
+// dependedOnTasks returns the set of task names that at least one task depends on.
+// Built in a single pass so callers can test membership without rescanning all tasks.
+func (cf *ComposeFile) dependedOnTasks() map[string]bool {
+	dependedOn := make(map[string]bool)
 	for _, task := range cf.Tasks {
 		for _, dep := range task.DependsOn {
-			if dep.Task == taskName {
-				return true
-			}
+			dependedOn[dep.Task] = true
 		}
 	}
-	return false
+	return dependedOn
 }
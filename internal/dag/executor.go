@@ -228,6 +228,10 @@ func (e *Executor) runDAG(graph *Graph, taskNames []string, iteration, totalIter
 	// Create prefixed writers for parallel output
 	writers := output.NewWriterGroup(e.cfg.Output, taskNames)
 
+	// The node set is fixed for the whole run, so sort it once up front
+	// instead of on every scheduling pass.
+	nodes := graph.GetNodes()
+
 	for {
 		// Check for pause/terminate before scheduling new tasks
 		if e.checkPipelineControl() {
@@ -238,7 +242,7 @@ func (e *Executor) runDAG(graph *Graph, taskNames []string, iteration, totalIter
 		currentStates := states.GetAll()
 
 		// Check for tasks that should be skipped
-		e.skipBlockedTasks(graph, states, currentStates, writers)
+		e.skipBlockedTasks(graph, nodes, states, currentStates, writers)
 
 		// Find tasks ready to run
 		readyTasks := graph.FindReadyTasks(currentStates)
@@ -273,8 +277,9 @@ func (e *Executor) runDAG(graph *Graph, taskNames []string, iteration, totalIter
 }
 
 // skipBlockedTasks marks tasks as skipped if their dependency conditions can't be met.
-func (e *Executor) skipBlockedTasks(graph *Graph, tracker *StateTracker, currentStates map[string]*TaskState, writers *output.WriterGroup) {
-	for _, task := range graph.GetNodes() {
+// nodes is the graph's sorted node list, computed once per run by the caller.
+func (e *Executor) skipBlockedTasks(graph *Graph, nodes []string, tracker *StateTracker, currentStates map[string]*TaskState, writers *output.WriterGroup) {
+	for _, task := range nodes {
 		state := currentStates[task]
 		if state == nil || state.Status != TaskPending {
 			continue
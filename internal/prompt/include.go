@@ -25,6 +25,11 @@ func processIncludesInternal(content string, baseDir string, depth int, seen map
 		return "", fmt.Errorf("maximum include depth (%d) exceeded - check for circular includes", maxIncludeDepth)
 	}
 
+	// Most prompts have no directives; a literal scan avoids the regexp engine
+	if !strings.Contains(content, "{{include:") {
+		return content, nil
+	}
+
 	// Find all include directives
 	matches := includeRegex.FindAllStringSubmatchIndex(content, -1)
 	if len(matches) == 0 {
@@ -14,6 +14,11 @@ var outputRegex = regexp.MustCompile(`\{\{output:\s*([^}]+)\}\}`)
 // contents of the corresponding task output file from the pipeline output directory.
 // If outputDir is empty (not running in a pipeline), missing-output placeholders are used.
 func ProcessOutputDirectives(content, outputDir string) (string, error) {
+	// Most prompts have no directives; a literal scan avoids the regexp engine
+	if !strings.Contains(content, "{{output:") {
+		return content, nil
+	}
+
 	matches := outputRegex.FindAllStringSubmatchIndex(content, -1)
 	if len(matches) == 0 {
 		return content, nil
@@ -1,6 +1,7 @@
 package state
 
 import (
+	"bytes"
 	"crypto/rand"
 	"encoding/hex"
 	"encoding/json"
@@ -68,6 +69,11 @@ type Manager struct {
 	scope      scope.Scope
 	workingDir string // Used for filtering when scope is ScopeProject
 	mu         sync.Mutex
+
+	// lastLoaded holds the raw state file contents read by the most recent
+	// load() so save() can skip rewriting an unchanged file. Only accessed
+	// while holding the lock.
+	lastLoaded []byte
 }
 
 // NewManager creates a new state manager.
@@ -629,12 +635,34 @@ func (m *Manager) Remove(id string) error {
 	return m.save(state)
 }
 
+// RemoveMany removes several agents from the state in a single load/save cycle.
+// IDs that are not present are ignored.
+func (m *Manager) RemoveMany(ids []string) error {
+	fl, err := m.lock()
+	if err != nil {
+		return err
+	}
+	defer m.unlock(fl)
+
+	state, err := m.load()
+	if err != nil {
+		return err
+	}
+
+	for _, id := range ids {
+		delete(state.Agents, id)
+	}
+	return m.save(state)
+}
+
 // WorkingDir returns the working directory used for filtering.
 func (m *Manager) WorkingDir() string {
 	return m.workingDir
 }
 
 func (m *Manager) load() (*State, error) {
+	m.lastLoaded = nil
+
 	data, err := os.ReadFile(m.statePath)
 	if err != nil {
 		if os.IsNotExist(err) {
@@ -652,15 +680,22 @@ func (m *Manager) load() (*State, error) {
 		state.Agents = make(map[string]*AgentState)
 	}
 
+	m.lastLoaded = data
 	return &state, nil
 }
 
+// save writes the state to disk. If the serialized state is identical to
+// what load() just read, the write is skipped.
 func (m *Manager) save(state *State) error {
 	data, err := json.MarshalIndent(state, "", "  ")
 	if err != nil {
 		return err
 	}
 
+	if m.lastLoaded != nil && bytes.Equal(data, m.lastLoaded) {
+		return nil
+	}
+
 	return os.WriteFile(m.statePath, data, 0644)
 }
 
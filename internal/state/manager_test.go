@@ -262,6 +262,38 @@ func TestManagerRemove(t *testing.T) {
 	}
 }
 
+func TestManagerRemoveMany(t *testing.T) {
+	mgr := newTestManager(t)
+
+	var ids []string
+	for i := 0; i < 3; i++ {
+		agent := &AgentState{
+			ID:        GenerateID(),
+			PID:       12345,
+			StartedAt: time.Now(),
+			Status:    "terminated",
+		}
+		if err := mgr.Register(agent); err != nil {
+			t.Fatalf("Register failed: %v", err)
+		}
+		ids = append(ids, agent.ID)
+	}
+
+	// Remove the first two plus an unknown ID, which should be ignored
+	if err := mgr.RemoveMany([]string{ids[0], ids[1], "missing"}); err != nil {
+		t.Fatalf("RemoveMany failed: %v", err)
+	}
+
+	for _, id := range ids[:2] {
+		if _, err := mgr.Get(id); err == nil {
+			t.Errorf("Get(%s) should fail after RemoveMany", id)
+		}
+	}
+	if _, err := mgr.Get(ids[2]); err != nil {
+		t.Errorf("Get(%s) failed for agent that was not removed: %v", ids[2], err)
+	}
+}
+
 func TestManagerGetNonExistent(t *testing.T) {
 	mgr, err := NewManager()
 	if err != nil {
@@ -648,3 +680,55 @@ func TestGetLastNoAgents(t *testing.T) {
 	}
 	// Note: This test is best-effort since other tests may leave agents in global state
 }
+
+func TestSaveSkipsUnchangedState(t *testing.T) {
+	mgr := newTestManager(t)
+
+	agent := &AgentState{
+		ID:        GenerateID(),
+		PID:       12345,
+		StartedAt: time.Now(),
+		Status:    "running",
+	}
+	if err := mgr.Register(agent); err != nil {
+		t.Fatalf("Register failed: %v", err)
+	}
+
+	// Backdate the state file so any rewrite is visible in its mtime
+	old := time.Now().Add(-time.Hour).Truncate(time.Second)
+	if err := os.Chtimes(mgr.statePath, old, old); err != nil {
+		t.Fatalf("Chtimes failed: %v", err)
+	}
+
+	// No-op update: agent is already unpaused
+	if err := mgr.SetPaused(agent.ID, false); err != nil {
+		t.Fatalf("SetPaused failed: %v", err)
+	}
+	info, err := os.Stat(mgr.statePath)
+	if err != nil {
+		t.Fatalf("Stat failed: %v", err)
+	}
+	if !info.ModTime().Equal(old) {
+		t.Errorf("state file rewritten for no-op update: mtime %v, want %v", info.ModTime(), old)
+	}
+
+	// Real change must still be written
+	if err := mgr.SetPaused(agent.ID, true); err != nil {
+		t.Fatalf("SetPaused failed: %v", err)
+	}
+	info, err = os.Stat(mgr.statePath)
+	if err != nil {
+		t.Fatalf("Stat failed: %v", err)
+	}
+	if info.ModTime().Equal(old) {
+		t.Error("state file not rewritten after change")
+	}
+
+	got, err := mgr.Get(agent.ID)
+	if err != nil {
+		t.Fatalf("Get failed: %v", err)
+	}
+	if !got.Paused {
+		t.Error("expected agent to be paused")
+	}
+}